@@ -0,0 +1,75 @@
+"""Retry and concurrency gates shared by every outbound OpenAI/Tavily call.
+
+Transient failures (429s, 5xx, dropped connections) are retried with
+exponential backoff and jitter, honoring `Retry-After` (capped at the 30s
+backoff maximum) when the server sends one. A semaphore per service caps
+in-flight requests so a wide fan-out stays within the account's RPM/TPM
+limits; like the HTTP pool, the semaphores are kept per running event loop.
+"""
+import asyncio
+import functools
+import os
+import weakref
+import httpx
+from openai import APIConnectionError, InternalServerError, RateLimitError
+from tenacity import (
+    retry,
+    retry_if_exception,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+CONCURRENCY = {
+    "openai": int(os.getenv("OPENAI_CONCURRENCY", "8")),
+    "tavily": int(os.getenv("TAVILY_CONCURRENCY", "8")),
+}
+
+_semaphores = weakref.WeakKeyDictionary()
+
+def _semaphore(service):
+    # asyncio primitives can't be shared between event loops.
+    per_loop = _semaphores.setdefault(asyncio.get_running_loop(), {})
+    if service not in per_loop:
+        per_loop[service] = asyncio.Semaphore(CONCURRENCY[service])
+    return per_loop[service]
+
+MAX_BACKOFF_SECONDS = 30
+_BACKOFF = wait_exponential_jitter(initial=1, max=MAX_BACKOFF_SECONDS)
+
+def _retry_after(exc):
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+def _wait(retry_state):
+    delay = _retry_after(retry_state.outcome.exception())
+    if delay is None:
+        return _BACKOFF(retry_state)
+    return min(max(delay, 0.0), MAX_BACKOFF_SECONDS)
+
+def _is_retryable_http_error(exc):
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+def _gated(service, retryable):
+    def decorator(func):
+        # The semaphore is held per attempt, not across backoff sleeps.
+        @retry(stop=stop_after_attempt(5), wait=_wait, retry=retryable, reraise=True)
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            async with _semaphore(service):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+retry_openai = _gated(
+    "openai",
+    retry_if_exception_type((RateLimitError, APIConnectionError, InternalServerError)),
+)
+retry_tavily = _gated("tavily", retry_if_exception(_is_retryable_http_error))
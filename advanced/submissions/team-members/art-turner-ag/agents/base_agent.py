@@ -1,15 +1,71 @@
+import asyncio
 import os
+import weakref
 from abc import ABC, abstractmethod
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI
+from ._net import retry_openai
 
-load_dotenv()
+# Skip reading .env when the keys are already in the environment.
+if not (os.environ.get("OPENAI_API_KEY") and os.environ.get("TAVILY_API_KEY")):
+    load_dotenv()
+
+# Read once at import; a missing OpenAI key still fails when the client is built.
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+
+# httpx connections belong to the event loop that opened them, so the shared
+# pool (and the AsyncOpenAI client on top of it) is kept per running loop.
+# Within a loop, splitter -> researchers -> synthesizer reuse warm TCP/TLS
+# connections; separate asyncio.run() calls each get their own pool.
+_http_clients = weakref.WeakKeyDictionary()
+_openai_clients = weakref.WeakKeyDictionary()
+
+def get_http_client():
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=30.0,
+        )
+        _http_clients[loop] = client
+    return client
+
+async def aclose_clients():
+    # Close the running loop's pool; the next request on this loop opens a new one.
+    loop = asyncio.get_running_loop()
+    _openai_clients.pop(loop, None)
+    client = _http_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
 
 class BaseAgent(ABC):
     def __init__(self, model="gpt-4o"):
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         self.model = model
 
+    @property
+    def client(self):
+        return BaseAgent._get_client(OPENAI_API_KEY)
+
+    @staticmethod
+    def _get_client(api_key):
+        # Every agent on a loop shares one AsyncOpenAI instance per API key.
+        # Retries are left to retry_openai so they don't stack or sleep
+        # inside the semaphore.
+        clients = _openai_clients.setdefault(asyncio.get_running_loop(), {})
+        if api_key not in clients:
+            clients[api_key] = AsyncOpenAI(
+                api_key=api_key, http_client=get_http_client(), max_retries=0
+            )
+        return clients[api_key]
+
+    @retry_openai
+    async def _chat(self, **kwargs):
+        return await self.client.chat.completions.create(**kwargs)
+
     @abstractmethod
-    def run(self, input_data):
+    async def run(self, input_data):
         pass
@@ -0,0 +1,151 @@
+"""Response caches for agent calls.
+
+`normalized_cache` matches inputs that differ only in case, punctuation,
+"the"/"an" or spacing ("The future of quantum computing?" vs "future of Quantum
+Computing"). Word order, numbers, any script's letters and the `+`/`#` in names
+like C++ and C# stay significant, so "type 1 diabetes" and "type 2 diabetes"
+never share an entry. `exact_cache` is keyed on a SHA-256 of
+the canonical arguments. Both persist to SQLite so repeat topics survive
+restarts.
+"""
+import dataclasses
+import functools
+import hashlib
+import inspect
+import json
+import os
+import re
+import sqlite3
+import time
+
+CACHE_PATH = os.getenv("SCHOLARAI_CACHE_PATH", ".scholarai_cache.sqlite3")
+
+# Unicode words, keeping a trailing + or # ("c++", "c#")
+_TOKEN_RE = re.compile(r"\w+[+#]*")
+# Only words that never change what a research topic means; prepositions like
+# "to"/"from" do ("migration to Europe" vs "migration from Europe"), and so can
+# "a" ("Hepatitis A vaccines").
+_STOPWORDS = frozenset({"an", "the", "s"})
+
+_conn = None
+
+def _connect():
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(CACHE_PATH)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS exact_cache "
+            "(key TEXT PRIMARY KEY, value TEXT, created REAL)"
+        )
+    return _conn
+
+def clear():
+    conn = _connect()
+    with conn:
+        conn.execute("DELETE FROM exact_cache")
+
+def _normalize(text):
+    # Casefolded words in their original order, minus articles and possessive 's
+    tokens = _TOKEN_RE.findall(text.casefold().replace("’", "'"))
+    return " ".join(t for t in tokens if t not in _STOPWORDS)
+
+def _namespace(agent, version):
+    # Bump `version` when a cached method's return shape changes.
+    return f"{type(agent).__name__}:{agent.model}:v{version}"
+
+def _encode(value):
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    return str(value)
+
+def _exact_key(agent, func, args, version):
+    payload = json.dumps([_namespace(agent, version), func.__name__, args], sort_keys=True, default=_encode)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def _exact_get(key, ttl):
+    conn = _connect()
+    row = conn.execute(
+        "SELECT value, created FROM exact_cache WHERE key = ?", (key,)
+    ).fetchone()
+    if row is None:
+        return None
+    value, created = row
+    if created < time.time() - ttl:
+        # Expired entries are dropped when they are looked up.
+        with conn:
+            conn.execute("DELETE FROM exact_cache WHERE key = ?", (key,))
+        return None
+    return json.loads(value)
+
+def _exact_put(key, value):
+    conn = _connect()
+    with conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO exact_cache VALUES (?, ?, ?)",
+            (key, json.dumps(value), time.time()),
+        )
+
+def normalized_cache(ttl=86400, version=1, key_attrs=(), cacheable=bool):
+    """Cache an agent's `run(text, ...)` result, keyed on normalized `text` plus the other arguments.
+
+    `key_attrs` names agent attributes that also change the result and so
+    belong in the key. Only results for which `cacheable(result)` is true are
+    stored, and text that normalizes to nothing is never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, text, *args, **kwargs):
+            normalized = _normalize(text)
+            if not normalized:
+                return await func(self, text, *args, **kwargs)
+
+            attrs = {name: getattr(self, name) for name in key_attrs}
+            key = _exact_key(self, func, [normalized, args, kwargs, attrs], version)
+            cached = _exact_get(key, ttl)
+            if cached is not None:
+                return cached
+
+            result = await func(self, text, *args, **kwargs)
+            if result and cacheable(result):
+                _exact_put(key, result)
+            return result
+        return wrapper
+    return decorator
+
+def exact_cache(ttl=86400, version=1):
+    """Cache an agent method's result keyed on a hash of its arguments.
+
+    Async generators that stream text are supported: a hit yields the cached
+    text in one piece, a miss passes chunks through and stores their join.
+    """
+    def decorator(func):
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def stream_wrapper(self, *args):
+                key = _exact_key(self, func, args, version)
+                cached = _exact_get(key, ttl)
+                if cached is not None:
+                    yield cached
+                    return
+
+                chunks = []
+                async for chunk in func(self, *args):
+                    chunks.append(chunk)
+                    yield chunk
+                if any(chunks):
+                    _exact_put(key, "".join(chunks))
+            return stream_wrapper
+
+        @functools.wraps(func)
+        async def wrapper(self, *args):
+            key = _exact_key(self, func, args, version)
+            cached = _exact_get(key, ttl)
+            if cached is not None:
+                return cached
+
+            result = await func(self, *args)
+            if result:
+                _exact_put(key, result)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+
+@dataclass(slots=True)
+class ResearchFindings:
+    """Per-sub-topic research results stored as aligned parallel lists."""
+
+    subtopics: list[str] = field(default_factory=list)
+    findings: list[str] = field(default_factory=list)
+    sources: list[list[dict]] = field(default_factory=list)
+
+    def append(self, subtopic, finding, sources=None):
+        self.subtopics.append(subtopic)
+        self.findings.append(finding)
+        self.sources.append(sources or [])
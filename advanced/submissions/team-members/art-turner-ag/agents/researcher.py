@@ -1,34 +1,92 @@
-from .base_agent import BaseAgent
-from tavily import TavilyClient
-import os
+from .base_agent import BaseAgent, TAVILY_API_KEY, get_http_client
+from .cache import normalized_cache
+from ._net import retry_tavily
+import functools
+
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+# Only the top sources make it into the summarization prompt.
+MAX_SOURCES = 3
+
+# OpenAI tokenizers average roughly four characters of English per token.
+CHARS_PER_TOKEN = 4
+
+RESEARCH_INSTRUCTIONS = """
+You are a researcher agent. Summarize findings based on search results.
+Research the sub-topic you are given using the provided search results.
+Provide a detailed summary including key insights and citations.
+"""
+
+class TavilySearchClient:
+    """Minimal Tavily search client that goes through the shared HTTP pool."""
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+
+    @retry_tavily
+    async def search(self, query, **kwargs):
+        response = await get_http_client().post(
+            TAVILY_SEARCH_URL,
+            json={"query": query, **kwargs},
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+        response.raise_for_status()
+        return response.json()
+
+@functools.lru_cache(maxsize=1)
+def _get_tavily_client(api_key):
+    return TavilySearchClient(api_key=api_key)
 
 class ResearcherAgent(BaseAgent):
-    def __init__(self, model="gpt-4o"):
+    def __init__(self, model="gpt-4o-mini", per_source_token_budget=800):
         super().__init__(model)
-        self.tavily = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
+        self.per_source_token_budget = per_source_token_budget
+        self.tavily = _get_tavily_client(TAVILY_API_KEY)
 
-    def run(self, subtopic):
-        # 1. Search using Tavily
-        search_result = self.tavily.search(query=subtopic, search_depth="advanced")
-        results = search_result.get("results", [])
-        
-        context = "\n\n".join([f"Source: {r['url']}\nContent: {r['content']}" for r in results[:3]])
+    @normalized_cache(
+        ttl=86400,
+        version=3,
+        key_attrs=("per_source_token_budget",),
+        cacheable=lambda result: bool(result["finding"]),
+    )
+    async def run(self, subtopic, search_query=None):
+        # Each sub-topic summarizes as soon as its own search lands, so no
+        # sub-topic waits on another's Tavily call.
+        results = await self.search(subtopic, search_query)
+        finding = await self.summarize(subtopic, results)
+        sources = [{"title": r.get("title", ""), "url": r["url"]} for r in results]
+        return {"finding": finding, "sources": sources}
+
+    async def search(self, subtopic, search_query=None):
+        # Search using Tavily, preferring the query planned by the splitter
+        search_result = await self.tavily.search(
+            query=search_query or subtopic,
+            search_depth="advanced",
+            max_results=MAX_SOURCES,
+            include_answer=False,
+            include_raw_content=False,
+        )
+        return search_result.get("results", [])
+
+    async def summarize(self, subtopic, results):
+        # Cap each source before prompting; summarization is lossy anyway.
+        max_chars = self.per_source_token_budget * CHARS_PER_TOKEN
+        context = "\n\n".join([
+            f"Source: {r['url']}\nContent: {r['content'][:max_chars]}"
+            for r in results
+        ])
         
-        # 2. Summarize findings
         prompt = f"""
-        Research the following sub-topic using the provided search results.
-        Provide a detailed summary including key insights and citations.
-        
         Sub-topic: {subtopic}
         
         Search Results:
         {context}
         """
         
-        response = self.client.chat.completions.create(
+        response = await self._chat(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are a researcher agent. Summarize findings based on search results."},
+                {"role": "system", "content": RESEARCH_INSTRUCTIONS},
                 {"role": "user", "content": prompt}
             ]
         )
@@ -1,34 +1,56 @@
 from .base_agent import BaseAgent
+from .cache import exact_cache
+
+# Fixed report instructions go in the system role; the topic and findings go
+# in the user message.
+REPORT_SCHEMA = """
+You are a synthesizer agent. Create a comprehensive report from research findings.
+Synthesize the research findings you are given into a comprehensive report on the main topic.
+
+The report should include:
+1. Executive Summary
+2. Key Insights by Sub-topic
+3. Conflicts or Gaps
+4. References (based on the provided sources)
+"""
+
+def _format_sources(sources):
+    if not sources:
+        return ""
+    lines = "".join(f"- {source['title'] or source['url']}: {source['url']}\n" for source in sources)
+    return f"Sources:\n{lines}\n"
 
 class SynthesizerAgent(BaseAgent):
-    def run(self, topic, research_findings):
-        # research_findings is a dict {subtopic: finding}
-        
-        findings_text = ""
-        for subtopic, finding in research_findings.items():
-            findings_text += f"## Sub-topic: {subtopic}\n{finding}\n\n"
+    async def run(self, topic, research_findings):
+        return "".join([chunk async for chunk in self.stream(topic, research_findings)])
+
+    @exact_cache(ttl=86400, version=2)
+    async def stream(self, topic, research_findings):
+        # research_findings is a ResearchFindings of aligned sub-topics, findings
+        # and the sources each finding was written from (for the References).
+        findings_text = "".join(
+            f"## Sub-topic: {subtopic}\n{finding}\n\n{_format_sources(sources)}"
+            for subtopic, finding, sources in zip(
+                research_findings.subtopics, research_findings.findings, research_findings.sources
+            )
+        )
             
         prompt = f"""
-        Synthesize the following research findings into a comprehensive report on the main topic.
-        
         Main Topic: {topic}
         
         Findings:
         {findings_text}
-        
-        The report should include:
-        1. Executive Summary
-        2. Key Insights by Sub-topic
-        3. Conflicts or Gaps
-        4. References (based on the provided sources)
         """
         
-        response = self.client.chat.completions.create(
+        response = await self._chat(
             model=self.model,
             messages=[
-                {"role": "system", "content": "You are a synthesizer agent. Create a comprehensive report from research findings."},
+                {"role": "system", "content": REPORT_SCHEMA},
                 {"role": "user", "content": prompt}
-            ]
+            ],
+            stream=True
         )
         
-        return response.choices[0].message.content
+        async for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
@@ -1,36 +1,64 @@
 from .base_agent import BaseAgent
-import json
+from .cache import normalized_cache
+import orjson
+
+# Structured output guarantees {"subtopics": [{"name", "search_query"}, ...]}.
+SUBTOPICS_SCHEMA = {
+    "name": "subtopics",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "subtopics": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string"},
+                        "search_query": {"type": "string"},
+                    },
+                    "required": ["name", "search_query"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+        "required": ["subtopics"],
+        "additionalProperties": False,
+    },
+}
 
 class TopicSplitterAgent(BaseAgent):
-    def run(self, topic):
+    def __init__(self, model="gpt-4o-mini"):
+        super().__init__(model)
+
+    @normalized_cache(ttl=86400, version=2)
+    async def run(self, topic):
         prompt = f"""
         Split the following research topic into 3 distinct, focused sub-topics for further research.
-        Return the result as a JSON list of strings.
+        For each sub-topic, also write a concise web search query that will find the best sources for it.
         
         Topic: {topic}
         """
         
-        response = self.client.chat.completions.create(
+        response = await self._chat(
             model=self.model,
             messages=[
                 {"role": "system", "content": "You are a helpful research assistant that splits topics into sub-topics."},
                 {"role": "user", "content": prompt}
             ],
-            response_format={"type": "json_object"}
+            response_format={"type": "json_schema", "json_schema": SUBTOPICS_SCHEMA}
         )
         
-        content = response.choices[0].message.content
+        choice = response.choices[0]
+        content = choice.message.content
+        if not content or choice.finish_reason == "length":
+            # The model refused or was cut off; there is nothing usable to research.
+            return []
         try:
-            subtopics = json.loads(content)
-            # Handle cases where the LLM might return a dict with a key like "subtopics"
-            if isinstance(subtopics, dict):
-                # Look for a list value
-                for key, value in subtopics.items():
-                    if isinstance(value, list):
-                        return value
-                # If no list found, return the keys? Or just fail gracefully.
-                # Let's assume it might be {"subtopics": [...]}
-                return list(subtopics.values())[0] if subtopics else []
-            return subtopics
-        except json.JSONDecodeError:
+            subtopics = orjson.loads(content)["subtopics"]
+            return [
+                {"name": subtopic["name"], "search_query": subtopic["search_query"] or subtopic["name"]}
+                for subtopic in subtopics
+            ]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
             return []
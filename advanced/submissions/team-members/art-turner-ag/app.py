@@ -1,12 +1,18 @@
 import gradio as gr
-from workflow import ResearchWorkflow
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
+_workflow = None
 
-def run_research(topic, progress=gr.Progress()):
-    workflow = ResearchWorkflow()
+def get_workflow():
+    # Agents (and the openai/httpx stack behind them) load on the first
+    # research request instead of at UI start-up.
+    global _workflow
+    if _workflow is None:
+        from workflow import ResearchWorkflow
+        _workflow = ResearchWorkflow()
+    return _workflow
+
+async def run_research(topic, progress=gr.Progress()):
+    workflow = get_workflow()
     
     def progress_callback(message, step=None, total_steps=None):
         if step is not None and total_steps is not None:
@@ -14,13 +20,14 @@ def run_research(topic, progress=gr.Progress()):
         else:
             progress(0, desc=message)
 
-    final_report, research_findings = workflow.run(topic, progress_callback=progress_callback)
-    
     findings_display = ""
-    for subtopic, finding in research_findings.items():
-        findings_display += f"## {subtopic}\n{finding}\n\n---\n\n"
-        
-    return final_report, findings_display
+    async for final_report, research_findings in workflow.stream(topic, progress_callback=progress_callback):
+        if not findings_display:
+            findings_display = "".join(
+                f"## {subtopic}\n{finding}\n\n---\n\n"
+                for subtopic, finding in zip(research_findings.subtopics, research_findings.findings)
+            )
+        yield final_report, findings_display
 
 with gr.Blocks(title="ScholarAI Advanced Research Agent") as demo:
     gr.Markdown("# 🎓 ScholarAI Advanced Research Agent")
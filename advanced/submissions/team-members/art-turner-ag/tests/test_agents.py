@@ -1,67 +1,119 @@
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import sys
 import os
 
 # Add parent directory to path to import agents
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SCHOLARAI_CACHE_PATH", ":memory:")
 
+from agents import cache
 from agents.topic_splitter import TopicSplitterAgent
 from agents.researcher import ResearcherAgent
 from agents.synthesizer import SynthesizerAgent
+from agents.models import ResearchFindings
 
-class TestAgents(unittest.TestCase):
-    @patch('agents.base_agent.OpenAI')
-    def test_topic_splitter(self, mock_openai):
+class TestAgents(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch('agents.base_agent.BaseAgent._get_client')
+    async def test_topic_splitter(self, mock_openai):
         # Mock OpenAI response
         mock_client = MagicMock()
         mock_openai.return_value = mock_client
         mock_response = MagicMock()
-        mock_response.choices[0].message.content = '["Subtopic 1", "Subtopic 2", "Subtopic 3"]'
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_response.choices[0].message.content = (
+            '{"subtopics": [{"name": "Subtopic 1", "search_query": "query 1"},'
+            ' {"name": "Subtopic 2", "search_query": ""}]}'
+        )
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
         
         agent = TopicSplitterAgent()
-        result = agent.run("Test Topic")
+        result = await agent.run("Test Topic")
         
-        self.assertEqual(result, ["Subtopic 1", "Subtopic 2", "Subtopic 3"])
+        self.assertEqual(result, [
+            {"name": "Subtopic 1", "search_query": "query 1"},
+            {"name": "Subtopic 2", "search_query": "Subtopic 2"},
+        ])
+
+    @patch('agents.base_agent.BaseAgent._get_client')
+    async def test_topic_splitter_returns_empty_on_bad_output(self, mock_openai):
+        mock_client = MagicMock()
+        mock_openai.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock()
+        agent = TopicSplitterAgent()
+
+        cases = [
+            ("stop", '{"subtopics": [{"name": "Sub'),
+            ("stop", '{"topics": []}'),
+            ("length", '{"subtopics": []}'),
+        ]
+        for finish_reason, content in cases:
+            with self.subTest(content=content):
+                cache.clear()
+                mock_response = MagicMock()
+                mock_response.choices[0].finish_reason = finish_reason
+                mock_response.choices[0].message.content = content
+                mock_client.chat.completions.create.return_value = mock_response
 
-    @patch('agents.base_agent.OpenAI')
-    @patch('agents.researcher.TavilyClient')
-    def test_researcher(self, mock_tavily, mock_openai):
+                self.assertEqual(await agent.run("Test Topic"), [])
+
+    @patch('agents.base_agent.BaseAgent._get_client')
+    @patch('agents.researcher._get_tavily_client')
+    async def test_researcher(self, mock_tavily, mock_openai):
         # Mock Tavily response
         mock_tavily_client = MagicMock()
         mock_tavily.return_value = mock_tavily_client
-        mock_tavily_client.search.return_value = {
+        mock_tavily_client.search = AsyncMock(return_value={
             "results": [
-                {"url": "http://example.com", "content": "Example content"}
+                {"title": "Example", "url": "http://example.com", "content": "Example content"}
             ]
-        }
+        })
         
         # Mock OpenAI response
         mock_openai_client = MagicMock()
         mock_openai.return_value = mock_openai_client
         mock_response = MagicMock()
         mock_response.choices[0].message.content = "Summary of findings"
-        mock_openai_client.chat.completions.create.return_value = mock_response
+        mock_openai_client.chat.completions.create = AsyncMock(return_value=mock_response)
         
         agent = ResearcherAgent()
-        result = agent.run("Subtopic 1")
+        result = await agent.run("Subtopic 1", "query 1")
         
-        self.assertEqual(result, "Summary of findings")
+        self.assertEqual(result, {
+            "finding": "Summary of findings",
+            "sources": [{"title": "Example", "url": "http://example.com"}],
+        })
+        self.assertEqual(mock_tavily_client.search.call_args.kwargs["query"], "query 1")
+        self.assertEqual(mock_tavily_client.search.call_args.kwargs["max_results"], 3)
 
-    @patch('agents.base_agent.OpenAI')
-    def test_synthesizer(self, mock_openai):
-        # Mock OpenAI response
+    @patch('agents.base_agent.BaseAgent._get_client')
+    async def test_synthesizer(self, mock_openai):
+        # Mock a streamed OpenAI response
         mock_client = MagicMock()
         mock_openai.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices[0].message.content = "Final Report"
-        mock_client.chat.completions.create.return_value = mock_response
+        chunks = []
+        for text in ["Final ", "Report"]:
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = text
+            chunks.append(chunk)
+
+        async def stream():
+            for chunk in chunks:
+                yield chunk
+
+        mock_client.chat.completions.create = AsyncMock(return_value=stream())
         
         agent = SynthesizerAgent()
-        result = agent.run("Test Topic", {"Subtopic 1": "Finding 1"})
+        findings = ResearchFindings()
+        findings.append("Subtopic 1", "Finding 1", [{"title": "Example", "url": "http://example.com"}])
+        result = await agent.run("Test Topic", findings)
         
         self.assertEqual(result, "Final Report")
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        self.assertTrue(call_kwargs["stream"])
+        self.assertIn("- Example: http://example.com", call_kwargs["messages"][1]["content"])
 
 if __name__ == '__main__':
     unittest.main()
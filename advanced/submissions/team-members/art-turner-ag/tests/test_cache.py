@@ -0,0 +1,148 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import agents
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("SCHOLARAI_CACHE_PATH", ":memory:")
+
+from agents import cache
+
+class EchoAgent:
+    model = "test-model"
+
+    def __init__(self):
+        self.calls = 0
+
+    @cache.normalized_cache()
+    async def run(self, text, search_query=None):
+        self.calls += 1
+        return f"result for {text}"
+
+    @cache.exact_cache()
+    async def combine(self, topic, findings):
+        self.calls += 1
+        return f"{topic}: {len(findings)}"
+
+    @cache.exact_cache()
+    async def stream(self, topic):
+        self.calls += 1
+        for word in ("report ", "on ", topic):
+            yield word
+
+class SummaryAgent:
+    model = "test-model"
+
+    def __init__(self, budget, finding):
+        self.budget = budget
+        self.finding = finding
+        self.calls = 0
+
+    @cache.normalized_cache(key_attrs=("budget",), cacheable=lambda result: bool(result["finding"]))
+    async def run(self, text):
+        self.calls += 1
+        return {"finding": self.finding}
+
+class TestCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        cache.clear()
+
+    async def test_normalized_cache_ignores_case_punctuation_and_articles(self):
+        agent = EchoAgent()
+        first = await agent.run("The future of quantum computing?")
+        second = await agent.run("future of  Quantum Computing")
+
+        self.assertEqual(first, second)
+        self.assertEqual(agent.calls, 1)
+
+    async def test_normalized_cache_misses_unrelated_input(self):
+        agent = EchoAgent()
+        await agent.run("future of quantum computing")
+        result = await agent.run("history of the printing press")
+
+        self.assertEqual(result, "result for history of the printing press")
+        self.assertEqual(agent.calls, 2)
+
+    async def test_normalized_cache_misses_near_misses(self):
+        near_misses = [
+            ("Treatment options for type 1 diabetes in children",
+             "Treatment options for type 2 diabetes in children"),
+            ("Renewable energy policy in the European Union 2020",
+             "Renewable energy policy in the European Union 2024"),
+            ("effects of social media on teenagers",
+             "effects of teenagers on social media"),
+            ("migration to Europe", "migration from Europe"),
+            ("量子计算的未来", "История Рима"),
+            ("C++ memory safety", "C# memory safety"),
+            ("C# memory safety", "C memory safety"),
+            ("Hepatitis A vaccines", "Hepatitis vaccines"),
+            ("café culture", "caf culture"),
+        ]
+        for first, second in near_misses:
+            with self.subTest(second=second):
+                cache.clear()
+                agent = EchoAgent()
+                await agent.run(first)
+                result = await agent.run(second)
+
+                self.assertEqual(result, f"result for {second}")
+                self.assertEqual(agent.calls, 2)
+
+    async def test_normalized_cache_keys_on_other_arguments(self):
+        agent = EchoAgent()
+        await agent.run("Solar storage", "grid battery costs")
+        await agent.run("Solar storage", "home battery adoption")
+        await agent.run("Solar storage", "grid battery costs")
+
+        self.assertEqual(agent.calls, 2)
+
+    async def test_normalized_cache_skips_text_without_words(self):
+        agent = EchoAgent()
+        await agent.run("???")
+        await agent.run("???")
+
+        self.assertEqual(agent.calls, 2)
+
+    async def test_normalized_cache_keys_on_agent_attributes(self):
+        small = SummaryAgent(budget=200, finding="short")
+        large = SummaryAgent(budget=800, finding="long")
+        await small.run("Solar storage")
+
+        self.assertEqual(await large.run("Solar storage"), {"finding": "long"})
+        self.assertEqual(await SummaryAgent(200, "other").run("Solar storage"), {"finding": "short"})
+
+    async def test_normalized_cache_skips_uncacheable_results(self):
+        agent = SummaryAgent(budget=800, finding=None)
+        await agent.run("Solar storage")
+        await agent.run("Solar storage")
+
+        self.assertEqual(agent.calls, 2)
+
+    async def test_expired_entries_are_recomputed(self):
+        agent = EchoAgent()
+        await agent.run("future of quantum computing")
+        with cache._connect() as conn:
+            conn.execute("UPDATE exact_cache SET created = created - 86401")
+        await agent.run("future of quantum computing")
+
+        self.assertEqual(agent.calls, 2)
+
+    async def test_exact_cache_ignores_dict_order(self):
+        agent = EchoAgent()
+        await agent.combine("Topic", {"a": "1", "b": "2"})
+        await agent.combine("Topic", {"b": "2", "a": "1"})
+        await agent.combine("Topic", {"a": "1"})
+
+        self.assertEqual(agent.calls, 2)
+
+    async def test_exact_cache_replays_stream_in_one_chunk(self):
+        agent = EchoAgent()
+        first = [chunk async for chunk in agent.stream("Topic")]
+        second = [chunk async for chunk in agent.stream("Topic")]
+
+        self.assertEqual(first, ["report ", "on ", "Topic"])
+        self.assertEqual(second, ["report on Topic"])
+        self.assertEqual(agent.calls, 1)
+
+if __name__ == '__main__':
+    unittest.main()
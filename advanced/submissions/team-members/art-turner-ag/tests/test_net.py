@@ -0,0 +1,83 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+
+import httpx
+
+# Add parent directory to path to import agents
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents._net import MAX_BACKOFF_SECONDS, _semaphore, _wait, retry_tavily
+from agents.base_agent import BaseAgent, aclose_clients, get_http_client
+
+def _status_error(status_code, headers=None):
+    request = httpx.Request("POST", "https://api.tavily.com/search")
+    response = httpx.Response(status_code, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+class TestNet(unittest.IsolatedAsyncioTestCase):
+    async def test_retries_rate_limit_honoring_retry_after(self):
+        calls = []
+
+        @retry_tavily
+        async def search():
+            calls.append(1)
+            if len(calls) == 1:
+                raise _status_error(429, {"Retry-After": "0"})
+            return {"results": []}
+
+        self.assertEqual(await search(), {"results": []})
+        self.assertEqual(len(calls), 2)
+
+    async def test_does_not_retry_client_errors(self):
+        calls = []
+
+        @retry_tavily
+        async def search():
+            calls.append(1)
+            raise _status_error(401)
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            await search()
+        self.assertEqual(len(calls), 1)
+
+    def test_retry_after_is_capped_at_backoff_maximum(self):
+        retry_state = MagicMock()
+        retry_state.outcome.exception.return_value = _status_error(429, {"Retry-After": "3600"})
+
+        self.assertEqual(_wait(retry_state), MAX_BACKOFF_SECONDS)
+
+class TestCloseClients(unittest.IsolatedAsyncioTestCase):
+    async def test_aclose_clients_closes_and_forgets_the_loop_pool(self):
+        client = get_http_client()
+        openai_client = BaseAgent._get_client("test-key")
+
+        await aclose_clients()
+
+        self.assertTrue(client.is_closed)
+        self.assertIsNot(get_http_client(), client)
+        self.assertIsNot(BaseAgent._get_client("test-key"), openai_client)
+        await aclose_clients()
+
+class TestPerLoopResources(unittest.TestCase):
+    def test_each_event_loop_gets_its_own_clients_and_semaphores(self):
+        async def resources():
+            client = get_http_client()
+            openai_client = BaseAgent._get_client("test-key")
+            # Repeated lookups on the same loop share one instance
+            self.assertIs(get_http_client(), client)
+            self.assertIs(BaseAgent._get_client("test-key"), openai_client)
+            self.assertIs(_semaphore("tavily"), _semaphore("tavily"))
+            await client.aclose()
+            return client, openai_client, _semaphore("tavily")
+
+        first = asyncio.run(resources())
+        second = asyncio.run(resources())
+
+        for a, b in zip(first, second):
+            self.assertIsNot(a, b)
+
+if __name__ == '__main__':
+    unittest.main()
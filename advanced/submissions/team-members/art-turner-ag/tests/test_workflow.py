@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+import sys
+import os
+
+# Add parent directory to path to import agents
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from agents import base_agent
+from workflow import ResearchWorkflow
+
+class TestWorkflow(unittest.IsolatedAsyncioTestCase):
+    @patch('agents.base_agent.BaseAgent._get_client', MagicMock())
+    async def test_run_keeps_subtopic_order_and_reports_errors(self):
+        workflow = ResearchWorkflow()
+        workflow.splitter.run = AsyncMock(return_value=[
+            {"name": "A", "search_query": "query a"},
+            {"name": "B", "search_query": "query b"},
+        ])
+
+        async def research(name, search_query):
+            if name == "B":
+                raise RuntimeError("search failed")
+            return {"finding": f"finding {name}", "sources": [{"title": "T", "url": "http://a"}]}
+
+        async def synthesize(topic, research_findings):
+            yield "Final "
+            yield "Report"
+
+        workflow.researcher.run = research
+        workflow.synthesizer.stream = synthesize
+
+        final_report, findings = await workflow.run("Topic", progress_callback=MagicMock())
+
+        self.assertEqual(final_report, "Final Report")
+        self.assertEqual(findings.subtopics, ["A", "B"])
+        self.assertEqual(findings.findings, ["finding A", "Error: search failed"])
+        self.assertEqual(findings.sources, [[{"title": "T", "url": "http://a"}], []])
+
+    @patch('agents.base_agent.BaseAgent._get_client', MagicMock())
+    async def test_run_closes_the_loop_http_pool(self):
+        workflow = ResearchWorkflow()
+        workflow.splitter.run = AsyncMock(return_value=[])
+
+        async def synthesize(topic, research_findings):
+            yield "Report"
+
+        workflow.synthesizer.stream = synthesize
+        client = base_agent.get_http_client()
+
+        await workflow.run("Topic", progress_callback=MagicMock())
+
+        self.assertTrue(client.is_closed)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,4 @@
-from workflow import ResearchWorkflow
-from unittest.mock import MagicMock
-import sys
+import asyncio
 
 # Mocking dependencies to avoid actual API calls during verification if keys are missing or to save cost
 # However, for true verification, we might want to run with actual keys if available.
@@ -9,16 +7,17 @@ import sys
 
 if __name__ == "__main__":
     try:
+        from workflow import ResearchWorkflow
         workflow = ResearchWorkflow()
         # Use a simple topic to avoid long processing
         topic = "The benefits of drinking water"
         print(f"Running workflow for topic: {topic}")
-        final_report, findings = workflow.run(topic)
+        final_report, findings = asyncio.run(workflow.run(topic))
         
         print("\n--- Final Report ---")
         print(final_report[:200] + "...") # Print first 200 chars
-        print("\n--- Findings Keys ---")
-        print(list(findings.keys()))
+        print("\n--- Findings Sub-topics ---")
+        print(findings.subtopics)
         print("\nVerification Successful!")
     except Exception as e:
         print(f"Verification Failed: {e}")
@@ -1,7 +1,9 @@
 from agents.topic_splitter import TopicSplitterAgent
 from agents.researcher import ResearcherAgent
 from agents.synthesizer import SynthesizerAgent
-import concurrent.futures
+from agents.models import ResearchFindings
+from agents.base_agent import aclose_clients
+import asyncio
 
 class ResearchWorkflow:
     def __init__(self):
@@ -9,7 +11,20 @@ class ResearchWorkflow:
         self.researcher = ResearcherAgent()
         self.synthesizer = SynthesizerAgent()
 
-    def run(self, topic, progress_callback=None):
+    async def run(self, topic, progress_callback=None):
+        # One-shot entry point (e.g. asyncio.run(workflow.run(topic))): close the
+        # loop's pooled connections when done. stream() leaves them open so a
+        # long-lived loop like Gradio's keeps reusing them.
+        final_report, research_findings = "", ResearchFindings()
+        try:
+            async for final_report, research_findings in self.stream(topic, progress_callback):
+                pass
+        finally:
+            await aclose_clients()
+        return final_report, research_findings
+
+    async def stream(self, topic, progress_callback=None):
+        """Yield (report_so_far, research_findings) as the report is written."""
         def report_progress(message, step=None, total_steps=None):
             if progress_callback:
                 progress_callback(message, step, total_steps)
@@ -20,31 +35,39 @@ class ResearchWorkflow:
         
         # 1. Split Topic
         report_progress("Splitting topic...", 0.1, 3)
-        subtopics = self.splitter.run(topic)
-        print(f"Sub-topics: {subtopics}")
+        subtopics = await self.splitter.run(topic)
+        print(f"Sub-topics: {[subtopic['name'] for subtopic in subtopics]}")
         
         # 2. Parallel Research
         report_progress("Conducting research...", 1, 3)
-        research_findings = {}
-        
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_to_subtopic = {executor.submit(self.researcher.run, subtopic): subtopic for subtopic in subtopics}
-            completed_count = 0
-            for future in concurrent.futures.as_completed(future_to_subtopic):
-                subtopic = future_to_subtopic[future]
-                try:
-                    finding = future.result()
-                    research_findings[subtopic] = finding
-                except Exception as e:
-                    print(f"Error researching {subtopic}: {e}")
-                    research_findings[subtopic] = f"Error: {e}"
-                
+        completed_count = 0
+
+        async def research(subtopic):
+            nonlocal completed_count
+            try:
+                return await self.researcher.run(subtopic["name"], subtopic["search_query"])
+            finally:
                 completed_count += 1
-                report_progress(f"Researched {subtopic}", 1 + (completed_count / len(subtopics)), 3)
+                report_progress(f"Researched {subtopic['name']}", 1 + (completed_count / len(subtopics)), 3)
 
-        # 3. Synthesize
+        findings = await asyncio.gather(*(research(subtopic) for subtopic in subtopics), return_exceptions=True)
+
+        # gather preserves sub-topic order, so results line up with the splitter's list
+        research_findings = ResearchFindings()
+        for subtopic, result in zip(subtopics, findings):
+            name = subtopic["name"]
+            if isinstance(result, Exception):
+                print(f"Error researching {name}: {result}")
+                research_findings.append(name, f"Error: {result}")
+            else:
+                research_findings.append(name, result["finding"], result["sources"])
+
+        # 3. Synthesize, streaming the report as it is generated
         report_progress("Synthesizing findings...", 2, 3)
-        final_report = self.synthesizer.run(topic, research_findings)
+        final_report = ""
+        yield final_report, research_findings
+        async for chunk in self.synthesizer.stream(topic, research_findings):
+            final_report += chunk
+            yield final_report, research_findings
         
         report_progress("Research complete!", 3, 3)
-        return final_report, research_findings
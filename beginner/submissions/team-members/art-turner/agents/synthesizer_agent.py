@@ -1,11 +1,11 @@
 """Synthesizer Agent for generating structured research reports."""
 
 import os
-import json
+import orjson
 from typing import List, Dict, Optional
 from datetime import datetime
 from openai import OpenAI
-from models.report import ResearchReport, KeyFinding, Source
+from models.report import ResearchReport, KeyFinding, MetadataModel, Source
 
 
 class SynthesizerAgent:
@@ -119,7 +119,7 @@ Sources to analyze:
 
         # Parse response
         result_text = response.choices[0].message.content
-        result_data = json.loads(result_text)
+        result_data = orjson.loads(result_text)
 
         # Build ResearchReport
         report = self._build_report(topic, result_data, sources)
@@ -157,35 +157,31 @@ Sources to analyze:
         # Parse top sources
         top_sources_data = result_data.get("top_sources", [])
 
-        # If LLM didn't provide top sources, use the highest scored original sources
-        if not top_sources_data:
+        if top_sources_data:
+            # LLM output is untrusted, so validate it
+            top_sources = [
+                Source(
+                    title=s.get("title", ""),
+                    url=s.get("url", ""),
+                    snippet=s.get("snippet", ""),
+                    score=s.get("score"),
+                    why_matters=s.get("why_matters", "")
+                )
+                for s in top_sources_data[:5]  # Ensure max 5
+            ]
+        else:
+            # If LLM didn't provide top sources, use the highest scored original sources.
+            # These come straight from web_search(), so they skip validation.
             sorted_sources = sorted(
                 original_sources,
-                key=lambda x: x.get("score", 0),
+                key=lambda x: x.get("score") or 0,
                 reverse=True
             )[:5]
-            top_sources_data = [
-                {
-                    "title": s.get("title", ""),
-                    "url": s.get("url", ""),
-                    "snippet": s.get("snippet", ""),
-                    "score": s.get("score"),
-                    "why_matters": "High relevance score"
-                }
+            top_sources = [
+                Source.from_search_result(s, why_matters="High relevance score")
                 for s in sorted_sources
             ]
 
-        top_sources = [
-            Source(
-                title=s.get("title", ""),
-                url=s.get("url", ""),
-                snippet=s.get("snippet", ""),
-                score=s.get("score"),
-                why_matters=s.get("why_matters", "")
-            )
-            for s in top_sources_data[:5]  # Ensure max 5
-        ]
-
         # Build report
         report = ResearchReport(
             topic=topic,
@@ -193,11 +189,12 @@ Sources to analyze:
             key_findings=key_findings,
             conflicts_and_caveats=result_data.get("conflicts_and_caveats", ""),
             top_sources=top_sources,
-            metadata={
-                "timestamp": datetime.utcnow().isoformat(),
-                "model": self.model,
-                "num_sources_analyzed": len(original_sources)
-            }
+            # We built these values ourselves, so skip validation
+            metadata=MetadataModel.model_construct(
+                timestamp=datetime.utcnow(),
+                model=self.model,
+                num_sources_analyzed=len(original_sources)
+            )
         )
 
         return report
@@ -103,8 +103,8 @@ def research_and_synthesize(
             <p style='font-size: 16px; line-height: 1.6; color: #2c3e50;'>{escaped_tldr}</p>
             <hr style='margin: 20px 0;'>
             <p style='font-size: 14px;'>
-                <strong style='color: #2c3e50;'>Generated:</strong> <span style='color: #7f8c8d;'>{report.metadata.get('timestamp', 'N/A')}</span><br>
-                <strong style='color: #2c3e50;'>Sources Analyzed:</strong> <span style='color: #7f8c8d;'>{report.metadata.get('num_sources_analyzed', 'N/A')}</span><br>
+                <strong style='color: #2c3e50;'>Generated:</strong> <span style='color: #7f8c8d;'>{report.metadata.timestamp.isoformat() if report.metadata.timestamp else 'N/A'}</span><br>
+                <strong style='color: #2c3e50;'>Sources Analyzed:</strong> <span style='color: #7f8c8d;'>{report.metadata.num_sources_analyzed if report.metadata.num_sources_analyzed is not None else 'N/A'}</span><br>
                 <strong style='color: #2c3e50;'>Key Findings:</strong> <span style='color: #7f8c8d;'>{len(report.key_findings)}</span>
             </p>
         </div>
@@ -62,9 +62,10 @@ class MarkdownExporter:
         lines.append(f"# {report.topic}\n")
 
         # Metadata
-        if report.metadata:
-            timestamp = report.metadata.get("timestamp", "N/A")
-            model = report.metadata.get("model", "N/A")
+        metadata = report.metadata
+        if metadata.timestamp or metadata.model:
+            timestamp = metadata.timestamp.isoformat() if metadata.timestamp else "N/A"
+            model = metadata.model or "N/A"
             lines.append(f"*Generated: {timestamp} | Model: {model}*\n")
 
         lines.append("---\n")
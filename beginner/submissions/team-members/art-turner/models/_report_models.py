@@ -0,0 +1,236 @@
+"""Data models for research reports.
+
+This module defines the data structures using Pydantic, which provides:
+1. Automatic validation - ensures data types are correct
+2. Serialization - easy conversion to JSON/dict
+3. Documentation - field descriptions are self-documenting
+4. Type safety - IDE autocomplete and type checking
+
+Why Pydantic? It's the standard for modern Python data validation and
+is used by FastAPI, LangChain, and many other frameworks.
+
+Import these through models.report, which loads this module on first use.
+"""
+
+import functools
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+# Example report shown in ResearchReport's JSON schema
+_REPORT_EXAMPLE_PATH = Path(__file__).with_name("report_example.json")
+
+
+@functools.cache
+def _schema(cls: type) -> dict:
+    """Build a model's JSON schema once; later calls return the same dict."""
+    return cls.model_json_schema()
+
+
+@functools.cache
+def _report_example_bytes() -> bytes:
+    """Read the example report from disk the first time it is needed."""
+    return _REPORT_EXAMPLE_PATH.read_bytes()
+
+
+def _add_report_example(schema: dict) -> None:
+    """json_schema_extra hook: attach the example report to the schema."""
+    # Parse per call so every schema gets its own copy of the example
+    schema["example"] = orjson.loads(_report_example_bytes())
+
+
+class _ReportModel(BaseModel):
+    """Base class adding a memoized JSON schema to every report model."""
+
+    @classmethod
+    def cached_json_schema(cls) -> dict:
+        """
+        Return this model's JSON schema, computed only on the first call.
+
+        model_json_schema() walks every field each time it is called, which
+        adds up when the schema is sent to the LLM on every request. The
+        returned dict is shared between callers, so treat it as read-only.
+        """
+        return _schema(cls)
+
+
+class Source(_ReportModel):
+    """
+    Model for a source citation.
+
+    Represents a single web source with all its metadata.
+    This is used for the "Top 5 Sources" section of our reports.
+    """
+
+    # Field(...) means required field, the ... is Python's Ellipsis indicating no default
+    title: str = Field(..., description="Title of the source")
+    url: str = Field(..., description="URL of the source")
+    snippet: str = Field(..., description="Relevant excerpt or snippet from the source")
+
+    # Optional fields use None as default, indicated by Optional[type]
+    score: Optional[float] = Field(None, description="Relevance score (0-1)")
+
+    # This field is filled by the Synthesizer Agent to explain why each source matters
+    why_matters: Optional[str] = Field(
+        None, description="Explanation of why this source is important"
+    )
+
+    @classmethod
+    def from_search_result(cls, result: dict, why_matters: Optional[str] = None) -> "Source":
+        """
+        Build a Source from one of web_search()'s result dicts.
+
+        Those dicts come from our own search tool and are already shaped, so we
+        skip validation with model_construct() - much cheaper than the validated
+        constructor. Model (LLM) output should still go through Source(...).
+
+        Args:
+            result: Dict with 'title', 'url', 'snippet' and 'score' keys
+            why_matters: Optional explanation of why this source is important
+
+        Returns:
+            Source built from the result
+        """
+        return cls.model_construct(
+            title=result.get("title", ""),
+            url=result.get("url", ""),
+            snippet=result.get("snippet", ""),
+            score=result.get("score"),
+            why_matters=why_matters,
+        )
+
+
+class KeyFinding(_ReportModel):
+    """
+    Model for a key finding with citation.
+
+    Represents one insight discovered during research, along with the
+    sources that support it. This enforces our requirement that all
+    findings must be backed by citations.
+    """
+
+    # The actual insight or discovery
+    finding: str = Field(..., description="The key finding or insight")
+
+    # List of URLs that support this finding
+    # default_factory=list creates an empty list if none provided
+    # This is safer than using [] as default (which is mutable and can cause bugs)
+    citations: List[str] = Field(
+        default_factory=list,
+        description="List of source URLs supporting this finding"
+    )
+
+
+class MetadataModel(_ReportModel):
+    """
+    Model for report metadata.
+
+    The keys we always record are typed fields; anything else goes into
+    `extras` as plain strings.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    # When the report was generated (UTC)
+    timestamp: Optional[datetime] = Field(None, description="When the report was generated")
+
+    # Which OpenAI model synthesized the report
+    model: Optional[str] = Field(None, description="Model used to generate the report")
+
+    # How many search results the synthesizer had to choose from
+    num_sources_analyzed: Optional[int] = Field(
+        None, description="Number of sources analyzed"
+    )
+
+    # Free-form extra information, kept as strings so it always serializes cleanly
+    extras: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Any other metadata, as string values"
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _collect_extras(cls, data: Any) -> Any:
+        """Accept old-style flat metadata dicts by moving unknown keys into extras."""
+        if not isinstance(data, dict):
+            return data
+        known = {key: value for key, value in data.items() if key in cls.model_fields}
+        extras = {
+            key: str(value) for key, value in data.items() if key not in cls.model_fields
+        }
+        if extras:
+            known["extras"] = {**known.get("extras", {}), **extras}
+        return known
+
+
+class ResearchReport(_ReportModel):
+    """
+    Complete research report model.
+
+    This is the main data structure that represents a fully synthesized research report.
+    It contains all the components required by the project specification:
+    - TL;DR (≤120 words)
+    - Key findings with citations
+    - Conflicts & caveats
+    - Top 5 sources with explanations
+    """
+
+    # The original research question or topic from the user
+    topic: str = Field(..., description="The research topic or question")
+
+    # TL;DR summary - our specification requires ≤120 words
+    # max_length=800 chars is approximately 120 words (avg 6.7 chars/word)
+    # Pydantic will validate this doesn't exceed the limit
+    tldr: str = Field(
+        ...,
+        description="TL;DR summary (≤120 words)",
+        max_length=800  # Roughly 120 words
+    )
+
+    # List of key findings, each with supporting citations
+    # Using default_factory ensures each instance gets its own list
+    key_findings: List[KeyFinding] = Field(
+        default_factory=list,
+        description="List of key findings with citations"
+    )
+
+    # Discussion of any disagreements between sources or important limitations
+    # Empty string default means this section is optional but always present
+    conflicts_and_caveats: str = Field(
+        default="",
+        description="Discussion of conflicts between sources and important caveats"
+    )
+
+    # Top 5 most important/relevant sources
+    # max_length ensures we don't exceed the 5 source limit from the spec
+    top_sources: List[Source] = Field(
+        default_factory=list,
+        description="Top 5 most relevant sources",
+        max_length=5
+    )
+
+    # Extra data like timestamp, which model generated it, etc.
+    # Known keys are typed fields; anything else lands in metadata.extras
+    metadata: MetadataModel = Field(
+        default_factory=MetadataModel,
+        description="Additional metadata (timestamp, model used, etc.)"
+    )
+
+    def model_dump_summary(self) -> dict:
+        """Return a summary version of the report."""
+        return {
+            "topic": self.topic,
+            "tldr": self.tldr,
+            "num_findings": len(self.key_findings),
+            "num_sources": len(self.top_sources),
+        }
+
+    model_config = ConfigDict(
+        # Reports are immutable once the synthesizer has built them
+        frozen=True,
+        # The example is only loaded when a JSON schema is actually generated
+        json_schema_extra=_add_report_example,
+    )
@@ -19,7 +19,7 @@ from agents.research_agent import ResearchAgent
 from agents.synthesizer_agent import SynthesizerAgent
 from exporters.markdown_exporter import to_markdown, export_to_markdown
 from exporters.json_exporter import to_json, export_to_json
-from models.report import ResearchReport, KeyFinding, Source
+from models.report import ResearchReport, KeyFinding, MetadataModel, Source
 
 
 def test_data_models():
@@ -49,7 +49,7 @@ def test_data_models():
             key_findings=[finding],
             conflicts_and_caveats="Some conflicts exist.",
             top_sources=[source],
-            metadata={"test": True}
+            metadata=MetadataModel(extras={"test": "true"})
         )
 
         print("\n✓ Data models created successfully")
@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+import sys
+import os
+
+# Add parent directory to path to import tools
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools.multi_search import MultiSearchTool
+from tools.web_search import SourceRaw
+
+class FakeProvider:
+    """Search provider that answers (or fails) after a delay."""
+
+    def __init__(self, name, delay, error=None):
+        self.name = name
+        self.delay = delay
+        self.error = error
+        self.cancelled = False
+
+    async def search(self, query, max_results=10):
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+        return [SourceRaw(self.name, f"https://{self.name}.example", query)]
+
+class TestMultiSearchTool(unittest.IsolatedAsyncioTestCase):
+    async def test_returns_fastest_result_and_cancels_the_rest(self):
+        fast, slow = FakeProvider("fast", 0.01), FakeProvider("slow", 1)
+
+        results = await MultiSearchTool([slow, fast]).search("quantum")
+        await asyncio.sleep(0)
+
+        self.assertEqual(results[0].title, "fast")
+        self.assertTrue(slow.cancelled)
+
+    async def test_falls_back_when_a_provider_fails(self):
+        broken = FakeProvider("broken", 0, error=RuntimeError("down"))
+        backup = FakeProvider("backup", 0.02)
+
+        results = await MultiSearchTool([broken, backup]).search("quantum")
+
+        self.assertEqual(results[0].title, "backup")
+
+    async def test_raises_when_every_provider_fails(self):
+        tools = [
+            FakeProvider("a", 0, error=RuntimeError("a down")),
+            FakeProvider("b", 0.01, error=RuntimeError("b down")),
+        ]
+
+        with self.assertRaisesRegex(RuntimeError, "a down; b down"):
+            await MultiSearchTool(tools).search("quantum")
+
+    async def test_times_out_and_cancels_pending_providers(self):
+        slow = FakeProvider("slow", 1)
+
+        with self.assertRaisesRegex(RuntimeError, "timed out"):
+            await MultiSearchTool([slow], timeout=0.02).search("quantum")
+        await asyncio.sleep(0)
+
+        self.assertTrue(slow.cancelled)
+
+    def test_requires_a_provider(self):
+        with self.assertRaises(ValueError):
+            MultiSearchTool([])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import subprocess
+import unittest
+from datetime import datetime, timezone
+import sys
+import os
+
+from pydantic import ValidationError
+
+# Add parent directory to path to import models
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(PROJECT_DIR)
+
+from models.report import KeyFinding, MetadataModel, ResearchReport, Source
+
+def _modules_after(code):
+    """Run code in a fresh interpreter and return the names in sys.modules afterwards."""
+    script = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return set(output.split())
+
+class TestLazyImport(unittest.TestCase):
+    def test_importing_report_module_defers_pydantic(self):
+        modules = _modules_after("import models.report\nimport tools.web_search")
+
+        self.assertNotIn("models._report_models", modules)
+        self.assertNotIn("pydantic", modules)
+
+    def test_accessing_a_model_loads_it(self):
+        modules = _modules_after("from models.report import Source")
+
+        self.assertIn("models._report_models", modules)
+
+    def test_unknown_names_raise_attribute_error(self):
+        import models.report
+
+        with self.assertRaises(AttributeError):
+            models.report.NotAModel
+
+class TestResearchReport(unittest.TestCase):
+    def test_reports_are_frozen(self):
+        report = ResearchReport(topic="Topic", tldr="Summary")
+
+        with self.assertRaises(ValidationError):
+            report.tldr = "Changed"
+
+    def test_summary_follows_model_copy_updates(self):
+        report = ResearchReport(topic="Topic", tldr="x")
+        self.assertEqual(report.model_dump_summary()["tldr"], "x")
+
+        updated = report.model_copy(update={
+            "tldr": "y",
+            "key_findings": [KeyFinding(finding="New finding")],
+        })
+
+        self.assertEqual(updated.model_dump_summary(), {
+            "topic": "Topic",
+            "tldr": "y",
+            "num_findings": 1,
+            "num_sources": 0,
+        })
+
+class TestMetadataModel(unittest.TestCase):
+    def test_legacy_flat_dict_keys_move_into_extras(self):
+        report = ResearchReport(topic="Topic", tldr="Summary", metadata={
+            "timestamp": "2025-01-14T10:30:00Z",
+            "model": "gpt-4-turbo-preview",
+            "test": True,
+            "extras": {"run": "1"},
+        })
+
+        metadata = report.metadata
+        self.assertEqual(metadata.timestamp, datetime(2025, 1, 14, 10, 30, tzinfo=timezone.utc))
+        self.assertEqual(metadata.model, "gpt-4-turbo-preview")
+        self.assertIsNone(metadata.num_sources_analyzed)
+        self.assertEqual(metadata.extras, {"run": "1", "test": "True"})
+
+    def test_defaults_to_empty_metadata(self):
+        self.assertEqual(ResearchReport(topic="Topic", tldr="Summary").metadata, MetadataModel())
+
+class TestJsonSchema(unittest.TestCase):
+    def test_cached_json_schema_is_computed_once_per_class(self):
+        for model in (Source, KeyFinding, ResearchReport):
+            with self.subTest(model=model.__name__):
+                schema = model.cached_json_schema()
+
+                self.assertIs(model.cached_json_schema(), schema)
+                self.assertEqual(schema, model.model_json_schema())
+
+        self.assertNotEqual(Source.cached_json_schema(), KeyFinding.cached_json_schema())
+
+    def test_report_schema_includes_example(self):
+        first = ResearchReport.model_json_schema()
+        second = ResearchReport.model_json_schema()
+
+        self.assertEqual(first["example"]["topic"], "Recent advances in large language models")
+        # Each schema gets its own copy of the example
+        self.assertIsNot(first["example"], second["example"])
+        self.assertEqual(
+            ResearchReport.model_validate(first["example"]).metadata.model, "gpt-4-turbo-preview"
+        )
+
+class TestSource(unittest.TestCase):
+    def test_from_search_result_builds_source_without_validation(self):
+        result = {"title": "Paper", "url": "https://example.com", "snippet": "About", "score": 0.9}
+
+        source = Source.from_search_result(result, why_matters="High relevance score")
+
+        self.assertEqual(source, Source(
+            title="Paper",
+            url="https://example.com",
+            snippet="About",
+            score=0.9,
+            why_matters="High relevance score",
+        ))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+import sys
+import os
+
+import httpx
+import orjson
+
+# Add parent directory to path to import tools
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from tools import web_search as ws
+from tools.web_search import SourceRaw, WebSearchTool
+
+def _results(*titles):
+    return {"results": [
+        {
+            "title": title,
+            "url": f"https://example.com/{title}",
+            "content": f"About {title}",
+            "score": 0.5,
+        }
+        for title in titles
+    ]}
+
+class MockTavily:
+    """Serves queued responses (or a callable) through an httpx MockTransport."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.client = httpx.AsyncClient(transport=httpx.MockTransport(self.handle))
+
+    def handle(self, request):
+        self.requests.append(orjson.loads(request.content))
+        response = self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        if callable(response):
+            return response(request)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+class TestWebSearchTool(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        ws._cache.clear()
+
+    def tavily(self, *responses):
+        mock = MockTavily(*responses)
+        patcher = patch("tools.web_search.get_http_client", return_value=mock.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # No real backoff sleeps in tests
+        delay = patch("tools.web_search._retry_delay", return_value=0)
+        delay.start()
+        self.addCleanup(delay.stop)
+        return mock
+
+    def tool(self, **kwargs):
+        return WebSearchTool(api_key="test-key", requests_per_second=1000, **kwargs)
+
+    async def test_search_returns_sources(self):
+        mock = self.tavily(httpx.Response(200, json=_results("a", "b")))
+
+        results = await self.tool().search("quantum", max_results=2)
+
+        self.assertEqual(results[0], SourceRaw("a", "https://example.com/a", "About a", 0.5))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(mock.requests[0]["query"], "quantum")
+        self.assertEqual(mock.requests[0]["max_results"], 2)
+
+    async def test_retries_rate_limit_then_succeeds(self):
+        mock = self.tavily(
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(503),
+            httpx.Response(200, json=_results("a")),
+        )
+
+        results = await self.tool().search("quantum")
+
+        self.assertEqual([r.title for r in results], ["a"])
+        self.assertEqual(len(mock.requests), 3)
+
+    async def test_retries_transport_errors(self):
+        mock = self.tavily(httpx.ConnectError("boom"), httpx.Response(200, json=_results("a")))
+
+        self.assertEqual(len(await self.tool().search("quantum")), 1)
+        self.assertEqual(len(mock.requests), 2)
+
+    async def test_does_not_retry_client_errors(self):
+        mock = self.tavily(httpx.Response(401))
+
+        with self.assertRaises(RuntimeError):
+            await self.tool().search("quantum")
+        self.assertEqual(len(mock.requests), 1)
+
+    async def test_gives_up_after_max_attempts(self):
+        mock = self.tavily(httpx.Response(500))
+
+        with self.assertRaises(RuntimeError):
+            await self.tool().search("quantum")
+        self.assertEqual(len(mock.requests), ws._MAX_ATTEMPTS)
+
+    async def test_cache_hit_skips_request(self):
+        mock = self.tavily(httpx.Response(200, json=_results("a")))
+        tool = self.tool()
+
+        first = await tool.search("quantum", include_domains=["gov", "edu"])
+        second = await tool.search("quantum", include_domains=["edu", "gov"])
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(mock.requests), 1)
+
+    async def test_cache_entries_expire(self):
+        mock = self.tavily(httpx.Response(200, json=_results("a")))
+        tool = self.tool()
+
+        with patch("tools.web_search._CACHE_TTL_SECONDS", -1):
+            await tool.search("quantum")
+            await tool.search("quantum")
+        self.assertEqual(len(mock.requests), 2)
+
+    async def test_cache_evicts_least_recently_used(self):
+        mock = self.tavily(httpx.Response(200, json=_results("a")))
+        tool = self.tool()
+
+        with patch("tools.web_search._CACHE_MAX_ENTRIES", 2):
+            for query in ["one", "two", "one", "three", "one", "two"]:
+                await tool.search(query)
+        # "two" was evicted by "three"; "one" stayed warm
+        self.assertEqual([r["query"] for r in mock.requests], ["one", "two", "three", "two"])
+
+    async def test_identical_concurrent_searches_share_a_request(self):
+        mock = self.tavily(httpx.Response(200, json=_results("a")))
+        tool = self.tool()
+
+        results = await asyncio.gather(*(tool.search(q) for q in ["x", "x", "y", "x"]))
+
+        self.assertEqual(len(mock.requests), 2)
+        self.assertTrue(all(len(r) == 1 for r in results))
+        self.assertIsNot(results[0], results[1])
+
+    async def test_batch_search_isolates_failures(self):
+        def respond(request):
+            if orjson.loads(request.content)["query"] == "bad":
+                return httpx.Response(400)
+            return httpx.Response(200, json=_results("a"))
+        self.tavily(respond)
+
+        results = await self.tool().batch_search(["good", "bad", "also good"])
+
+        self.assertEqual(len(results[0]), 1)
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertEqual(len(results[2]), 1)
+
+    async def test_search_stream_yields_results_from_chunked_body(self):
+        body = orjson.dumps(_results(*"abcdef"))
+
+        async def chunks():
+            for i in range(0, len(body), 7):
+                yield body[i:i + 7]
+        mock = self.tavily(
+            httpx.Response(429), lambda request: httpx.Response(200, content=chunks())
+        )
+        tool = self.tool()
+
+        streamed = [source async for source in tool.search_stream("quantum")]
+
+        self.assertEqual([s.title for s in streamed], list("abcdef"))
+        self.assertIsInstance(streamed[0].score, float)
+        # The streamed results were cached
+        self.assertEqual(await tool.search("quantum"), streamed)
+        self.assertEqual(len(mock.requests), 2)
+
+    async def test_search_stream_wraps_errors(self):
+        self.tavily(httpx.Response(200, content=b'{"results": [{"title": '))
+
+        with self.assertRaises(RuntimeError):
+            [source async for source in self.tool().search_stream("quantum")]
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            WebSearchTool(api_key="test-key", requests_per_second=0)
+
+class TestRetryDelay(unittest.TestCase):
+    def test_honors_retry_after_up_to_the_cap(self):
+        self.assertEqual(ws._retry_delay(0, httpx.Response(429, headers={"Retry-After": "2"})), 2)
+        self.assertEqual(
+            ws._retry_delay(0, httpx.Response(429, headers={"Retry-After": "3600"})),
+            ws._MAX_BACKOFF_SECONDS,
+        )
+
+    def test_falls_back_to_jittered_backoff(self):
+        delay = ws._retry_delay(2, httpx.Response(503))
+        self.assertGreaterEqual(delay, 4)
+        self.assertLess(delay, 5)
+
+class TestTokenBucket(unittest.IsolatedAsyncioTestCase):
+    async def test_throttles_beyond_burst(self):
+        bucket = ws._TokenBucket(rate=20, burst=2)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        for _ in range(4):
+            await bucket.acquire()
+
+        # Two tokens are free; the next two wait 1/20s each
+        self.assertGreaterEqual(loop.time() - start, 0.09)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Shared async HTTP client for outbound API calls.
+
+Every web search goes through one pooled httpx.AsyncClient, so repeated queries
+reuse warm TCP/TLS connections instead of paying a fresh handshake each time.
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Coroutine, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# httpx connections are tied to the event loop that opened them, so we keep
+# one pooled client per loop rather than a single global instance.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Long-lived loop used to run async calls on behalf of synchronous callers
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide pooled HTTP client for the running event loop.
+
+    Returns:
+        An httpx.AsyncClient with a large keep-alive pool and HTTP/2 enabled
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=300,
+            ),
+            http2=True,
+        )
+        _clients[loop] = client
+    return client
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Unlike asyncio.run(), which creates and tears down a loop on every call,
+    this reuses one background loop so pooled connections stay alive between
+    synchronous calls.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        Whatever the coroutine returns
+    """
+    global _background_loop
+    with _background_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_background_loop.run_forever,
+                name="http-client-loop",
+                daemon=True,
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop).result()
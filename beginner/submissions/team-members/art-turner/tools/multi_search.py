@@ -0,0 +1,98 @@
+"""Race several search providers behind one async interface.
+
+A single provider's slowest responses (its tail latency) become ours too. By
+sending the same query to two or more providers and taking whichever answers
+first, a search is only as slow as the fastest healthy provider, and one
+vendor's outage no longer breaks the pipeline.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, List, Optional, Protocol, Sequence
+
+if TYPE_CHECKING:
+    from tools.web_search import SourceRaw
+
+
+class SearchProvider(Protocol):
+    """Anything with an async search() like WebSearchTool's."""
+
+    async def search(self, query: str, max_results: int = 10) -> List[SourceRaw]:
+        ...
+
+
+class MultiSearchTool:
+    """
+    Send each query to several search providers and return the first answer.
+
+    Providers that fail are skipped in favour of the ones still running;
+    once one provider succeeds, the others are cancelled.
+    """
+
+    def __init__(self, tools: Sequence[SearchProvider], timeout: Optional[float] = 30.0):
+        """
+        Initialize the multi-provider search tool.
+
+        Args:
+            tools: Search providers to race, e.g. WebSearchTool instances
+            timeout: Seconds to wait for any provider to succeed (None = no limit)
+
+        Raises:
+            ValueError: If no providers are given
+        """
+        if not tools:
+            raise ValueError("MultiSearchTool needs at least one search provider")
+
+        self.tools = list(tools)
+        self.timeout = timeout
+
+    async def search(self, query: str, max_results: int = 10) -> List[SourceRaw]:
+        """
+        Search all providers at once and return the first successful result.
+
+        Args:
+            query: The search query
+            max_results: Maximum number of results to return (default: 10)
+
+        Returns:
+            List of SourceRaw results from the fastest provider that succeeded
+
+        Raises:
+            RuntimeError: If every provider fails or none answers within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+
+        tasks = [
+            asyncio.create_task(tool.search(query, max_results=max_results))
+            for tool in self.tools
+        ]
+        errors: List[BaseException] = []
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Timed out with every provider still running
+                    break
+
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    # This provider failed; keep waiting for the others
+                    errors.append(task.exception())
+        finally:
+            # Stop the losers (no-op for tasks that already finished)
+            for task in tasks:
+                task.cancel()
+
+        if errors:
+            raise RuntimeError(
+                f"All {len(self.tools)} search providers failed or timed out: "
+                + "; ".join(str(error) for error in errors)
+            )
+        raise RuntimeError(f"Web search timed out after {self.timeout} seconds")
@@ -3,13 +3,208 @@
 This module provides a wrapper around the Tavily search API, which is specifically
 optimized for AI applications. Tavily returns high-quality, relevant search results
 with pre-extracted content and relevance scores.
+
+Searches are async and go straight to Tavily's REST endpoint through the shared
+keep-alive HTTP client, so many queries can be in flight on a single thread.
 """
 
+from __future__ import annotations
+
+import asyncio
 import os
-from typing import List, Dict, Optional
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Iterable, List, Dict, NamedTuple, Optional, Tuple, Union
+
+import httpx
+# ijson parses JSON incrementally, so streamed results never need the full body in memory
+import ijson
+# orjson parses JSON several times faster than the standard library
+import orjson
+from tools.http_client import get_http_client, run_sync
+
 # Tavily is an AI-optimized search API that returns clean, structured results
 # Better for research than raw Google search because it filters and ranks content
-from tavily import TavilyClient
+TAVILY_SEARCH_URL = "https://api.tavily.com/search"
+
+class SourceRaw(NamedTuple):
+    """
+    Compact, immutable search result used inside the tools package.
+
+    Searches can hold thousands of results (cache, dedupe, rerank), so they are
+    kept as plain tuples rather than Pydantic models: no per-instance __dict__,
+    no validation, and nothing to copy defensively. web_search() hands them
+    to agents as plain dicts, which SynthesizerAgent turns into report Sources.
+    """
+
+    title: str
+    url: str
+    snippet: str
+    score: float = 0.0
+    why_matters: Optional[str] = None
+
+    @classmethod
+    def from_tavily(cls, result: dict) -> "SourceRaw":
+        """Build a SourceRaw from one entry of a Tavily response's "results" list."""
+        return cls(
+            title=result.get("title", ""),
+            url=result.get("url", ""),
+            # Tavily calls the snippet "content"
+            snippet=result.get("content", ""),
+            score=result.get("score", 0.0),
+        )
+
+
+# Per-process LRU cache of recent search results, so repeated queries become a
+# memory read instead of a network round-trip (and don't burn Tavily quota).
+# Entries expire after a while because web results go stale.
+_CACHE_MAX_ENTRIES = 1024
+_CACHE_TTL_SECONDS = 600
+_cache: "OrderedDict[tuple, Tuple[float, Tuple[SourceRaw, ...]]]" = OrderedDict()
+# Searches can run on several event loops/threads, so guard the shared cache
+_cache_lock = threading.Lock()
+
+
+def _normalize_domains(domains: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Turn a domain list into a sorted, deduplicated tuple (hashable and order-free)."""
+    return tuple(sorted(set(domains))) if domains else ()
+
+
+def _cache_key(
+    query: str,
+    max_results: int,
+    search_depth: str,
+    include_domains: Tuple[str, ...],
+    exclude_domains: Tuple[str, ...],
+) -> tuple:
+    """Build a hashable cache key from a search's parameters."""
+    return (query, max_results, search_depth, include_domains, exclude_domains)
+
+
+def _build_payload(
+    query: str,
+    max_results: int,
+    search_depth: str,
+    include_domains: Tuple[str, ...],
+    exclude_domains: Tuple[str, ...],
+) -> dict:
+    """Build the JSON body for a Tavily search request."""
+    payload = {
+        "query": query,
+        "max_results": max_results,
+        "search_depth": search_depth,
+    }
+    # Only send the domain filters when they are set
+    if include_domains:
+        payload["include_domains"] = list(include_domains)
+    if exclude_domains:
+        payload["exclude_domains"] = list(exclude_domains)
+    return payload
+
+
+def _cache_get(key: tuple) -> Optional[List[SourceRaw]]:
+    """Return the cached results for key, or None if missing/expired."""
+    with _cache_lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > _CACHE_TTL_SECONDS:
+            del _cache[key]
+            return None
+        _cache.move_to_end(key)
+    # Results are immutable, so only the list itself needs to be fresh
+    return list(results)
+
+
+def _cache_put(key: tuple, results: List[SourceRaw]) -> None:
+    """Store results under key, evicting the least recently used entries."""
+    with _cache_lock:
+        _cache[key] = (time.monotonic(), tuple(results))
+        _cache.move_to_end(key)
+        while len(_cache) > _CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+# Transient failures (rate limiting, server errors, dropped connections) are
+# retried with exponential backoff plus jitter before a search gives up
+_MAX_ATTEMPTS = 5
+_MAX_BACKOFF_SECONDS = 30
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """Seconds to wait before retry number attempt, honoring Retry-After."""
+    if response is not None:
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return min(_MAX_BACKOFF_SECONDS, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            # Missing header, or an HTTP-date we don't bother parsing
+            pass
+    return min(_MAX_BACKOFF_SECONDS, 2 ** attempt + random.random())
+
+
+class _TokenBucket:
+    """
+    Client-side rate limiter that keeps us under Tavily's request cap.
+
+    Tokens refill at `rate` per second up to `burst`. A request that finds the
+    bucket empty reserves the next token (the count goes negative) and sleeps
+    until it is due, so waiting callers are released in arrival order. A plain
+    threading lock guards the counters because searches may run on several
+    event loops.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class _AsyncByteReader:
+    """Adapt an httpx byte stream to the async read() interface ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+
+    async def read(self, size: int = -1) -> bytes:
+        # Return at most size bytes (b"" at the end), keeping any leftover for the next call
+        if not self._buffer:
+            try:
+                self._buffer = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+        if size < 0:
+            size = len(self._buffer)
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _Batcher:
+    """Queue and dispatcher task that coalesce searches on one event loop."""
+
+    def __init__(self):
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task: Optional[asyncio.Task] = None
+        # Strong references to running rounds so they aren't garbage collected
+        self.in_flight: set = set()
 
 
 class WebSearchTool:
@@ -20,15 +215,34 @@ class WebSearchTool:
     making it easy to search the web and get structured results.
     """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        batch_size: int = 16,
+        max_wait_ms: float = 50,
+        requests_per_second: Optional[float] = None,
+        default_include_domains: Optional[Iterable[str]] = None,
+        default_exclude_domains: Optional[Iterable[str]] = None,
+    ):
         """
         Initialize the web search tool.
 
         Args:
             api_key: Tavily API key. If not provided, will use TAVILY_API_KEY from environment.
+            batch_size: Maximum number of queued searches dispatched in one round (default: 16)
+            max_wait_ms: Once several searches are queued together, how long to wait for
+                more to join the round (default: 50). A search that arrives alone is
+                dispatched immediately. Set to 0 to never wait.
+            requests_per_second: Client-side cap on Tavily requests per second. If not
+                provided, uses TAVILY_REQUESTS_PER_SECOND from environment (default: 5).
+            default_include_domains: Domains to restrict every search to, unless a call
+                passes its own include_domains
+            default_exclude_domains: Domains to exclude from every search, unless a call
+                passes its own exclude_domains
 
         Raises:
-            ValueError: If no API key is found in parameters or environment
+            ValueError: If no API key is found in parameters or environment, or if
+                requests_per_second is not positive
         """
         # Try to get API key from parameter first, then from environment variable
         # This pattern allows flexibility: can pass key directly or load from .env
@@ -38,78 +252,346 @@ class WebSearchTool:
         if not self.api_key:
             raise ValueError("TAVILY_API_KEY not found in environment variables")
 
-        # Initialize the Tavily client with our API key
-        # This client handles all HTTP requests to the Tavily API
-        self.client = TavilyClient(api_key=self.api_key)
+        self.batch_size = batch_size
+        self.max_wait_ms = max_wait_ms
 
-    def search(
+        # Throttle ourselves below the provider's rate limit instead of relying on 429s
+        if requests_per_second is None:
+            requests_per_second = float(os.getenv("TAVILY_REQUESTS_PER_SECOND", "5"))
+        if requests_per_second <= 0:
+            raise ValueError(
+                "requests_per_second (TAVILY_REQUESTS_PER_SECOND) must be greater than 0"
+            )
+        self._rate_limiter = _TokenBucket(
+            rate=requests_per_second, burst=max(1, int(requests_per_second))
+        )
+
+        # Domain policies are stored as sorted tuples so every search that uses
+        # them shares the same objects (and the same cache keys)
+        self.default_include_domains = _normalize_domains(default_include_domains)
+        self.default_exclude_domains = _normalize_domains(default_exclude_domains)
+
+        # One dispatch queue per event loop (asyncio queues can't cross loops)
+        self._batchers: Dict[asyncio.AbstractEventLoop, "_Batcher"] = {}
+
+    async def search(
         self,
         query: str,
         max_results: int = 10,
         search_depth: str = "advanced",
         include_domains: Optional[List[str]] = None,
         exclude_domains: Optional[List[str]] = None,
-    ) -> List[Dict[str, str]]:
+    ) -> List[SourceRaw]:
         """
         Search the web for relevant sources.
 
+        Recent identical searches are served from an in-memory cache (10 minute
+        TTL). Searches queued at the same time are coalesced into one dispatch
+        round: identical searches in a round share a single request, and the
+        rest are sent concurrently.
+
         Args:
             query: The search query (e.g., "quantum computing advances 2024")
             max_results: Maximum number of results to return (default: 10)
             search_depth: "basic" for quick results, "advanced" for deeper analysis (default: "advanced")
-            include_domains: Optional list of domains to restrict search to (e.g., ["edu", "gov"])
-            exclude_domains: Optional list of domains to exclude from results
+            include_domains: Optional list of domains to restrict search to (e.g., ["edu", "gov"]).
+                Defaults to the tool's default_include_domains.
+            exclude_domains: Optional list of domains to exclude from results.
+                Defaults to the tool's default_exclude_domains.
 
         Returns:
-            List of dictionaries with keys: 'title', 'url', 'snippet', 'score'
+            List of SourceRaw results with title, url, snippet and score
             Score is a float 0-1 indicating relevance (1.0 = most relevant)
 
         Raises:
             RuntimeError: If the search API call fails
         """
+        include_domains, exclude_domains = self._resolve_domains(include_domains, exclude_domains)
+
+        # Repeat queries are answered from the in-memory cache
+        key = _cache_key(query, max_results, search_depth, include_domains, exclude_domains)
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached
+
+        # Concurrent callers are coalesced into dispatch rounds by the batcher
+        results = await self._queue_and_await(
+            query, max_results, search_depth, include_domains, exclude_domains
+        )
+        _cache_put(key, results)
+        return results
+
+    def _resolve_domains(
+        self,
+        include_domains: Optional[Iterable[str]],
+        exclude_domains: Optional[Iterable[str]],
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Fall back to the tool-wide domain policies, or normalize the per-call ones."""
+        return (
+            self.default_include_domains
+            if include_domains is None
+            else _normalize_domains(include_domains),
+            self.default_exclude_domains
+            if exclude_domains is None
+            else _normalize_domains(exclude_domains),
+        )
+
+    async def search_stream(
+        self,
+        query: str,
+        max_results: int = 10,
+        search_depth: str = "advanced",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None,
+    ) -> AsyncIterator[SourceRaw]:
+        """
+        Search the web and yield each source as soon as it is parsed.
+
+        Same arguments and results as search(), but the Tavily response is
+        streamed and decoded incrementally, so the raw body and the full list of
+        result dicts are never held in memory at once, and callers can start
+        working on the first results before the response has fully arrived.
+        Streamed searches skip the batcher (they run immediately) but still use
+        the cache, rate limiter and retries.
+
+        Example:
+            async for source in tool.search_stream("fusion energy", max_results=20):
+                print(source.title)
+
+        Raises:
+            RuntimeError: If the search API call fails
+        """
+        include_domains, exclude_domains = self._resolve_domains(include_domains, exclude_domains)
+
+        key = _cache_key(query, max_results, search_depth, include_domains, exclude_domains)
+        cached = _cache_get(key)
+        if cached is not None:
+            for source in cached:
+                yield source
+            return
+
+        payload = _build_payload(query, max_results, search_depth, include_domains, exclude_domains)
+        results: List[SourceRaw] = []
         try:
-            # Make the API call to Tavily
-            # search_depth="advanced" means Tavily will:
-            #   - Visit more pages
-            #   - Extract more detailed content
-            #   - Provide better relevance scoring
-            # This is slower but gives higher quality results for research
-            response = self.client.search(
-                query=query,
-                max_results=max_results,
-                search_depth=search_depth,
-                include_domains=include_domains,
-                exclude_domains=exclude_domains,
+            http_response = await self._post_with_retry(payload, stream=True)
+        except Exception as e:
+            raise RuntimeError(f"Web search failed: {str(e)}")
+
+        try:
+            items = ijson.items_async(
+                _AsyncByteReader(http_response.aiter_bytes()), "results.item", use_float=True
             )
+            while True:
+                # Only parsing errors are wrapped; the caller's own errors pass through
+                try:
+                    result = await items.__anext__()
+                except StopAsyncIteration:
+                    break
+                except Exception as e:
+                    raise RuntimeError(f"Web search failed: {str(e)}")
+                source = SourceRaw.from_tavily(result)
+                results.append(source)
+                yield source
+        finally:
+            await http_response.aclose()
+
+        _cache_put(key, results)
+
+    async def _queue_and_await(self, *request) -> List[SourceRaw]:
+        """Queue a search request and wait for its dispatch round to answer it."""
+        loop = asyncio.get_running_loop()
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            # Forget batchers whose event loops have been closed
+            for stale_loop in [stale for stale in self._batchers if stale.is_closed()]:
+                del self._batchers[stale_loop]
+            batcher = self._batchers[loop] = _Batcher()
+
+        future = loop.create_future()
+        batcher.queue.put_nowait((request, future))
+        # Start a dispatcher if one isn't already draining the queue
+        if batcher.task is None or batcher.task.done():
+            batcher.task = loop.create_task(self._dispatch_pending(batcher))
+        return await future
+
+    async def _dispatch_pending(self, batcher: "_Batcher") -> None:
+        """Drain queued requests in rounds of up to batch_size, then exit."""
+        loop = asyncio.get_running_loop()
+        while not batcher.queue.empty():
+            batch = [batcher.queue.get_nowait()]
+            # Take whatever else is already queued without waiting
+            while len(batch) < self.batch_size and not batcher.queue.empty():
+                batch.append(batcher.queue.get_nowait())
+
+            # A lone search goes out right away; only a burst waits for stragglers
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while 1 < len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(batcher.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            # Run the round in the background so new arrivals don't wait on it
+            round_task = loop.create_task(self._dispatch_round(batch))
+            batcher.in_flight.add(round_task)
+            round_task.add_done_callback(batcher.in_flight.discard)
+
+    async def _dispatch_round(self, batch: List[tuple]) -> None:
+        """Issue one round of searches concurrently and resolve each caller's future."""
+        # Identical requests in a round share one Tavily call
+        waiters: Dict[tuple, List[asyncio.Future]] = {}
+        for request, future in batch:
+            waiters.setdefault(request, []).append(future)
+
+        results = await asyncio.gather(
+            *(self._search_now(*request) for request in waiters),
+            return_exceptions=True,
+        )
+        for futures, result in zip(waiters.values(), results):
+            for future in futures:
+                if future.done():
+                    # The caller gave up (e.g. was cancelled) before we answered
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    # Each caller gets its own list of the (immutable) results
+                    future.set_result(list(result))
+
+    async def _search_now(
+        self,
+        query: str,
+        max_results: int,
+        search_depth: str,
+        include_domains: Tuple[str, ...],
+        exclude_domains: Tuple[str, ...],
+    ) -> List[SourceRaw]:
+        """Send a single search request to Tavily right away."""
+        payload = _build_payload(query, max_results, search_depth, include_domains, exclude_domains)
+
+        try:
+            http_response = await self._post_with_retry(payload)
+            response = orjson.loads(http_response.content)
 
             # Transform Tavily's response format into our standardized format
             # We normalize the structure so the rest of our app doesn't need to know
             # about Tavily's specific response format
-            results = []
-            for result in response.get("results", []):
-                # .get() with default values ensures we handle missing fields gracefully
-                results.append({
-                    "title": result.get("title", ""),           # Page title
-                    "url": result.get("url", ""),               # Source URL
-                    "snippet": result.get("content", ""),       # Extracted text content
-                    "score": result.get("score", 0.0),          # Relevance score (0-1)
-                })
-
-            return results
+            return [SourceRaw.from_tavily(result) for result in response.get("results", [])]
 
         except Exception as e:
             # Wrap any errors in a RuntimeError with context
             # This helps with debugging and error handling upstream
             raise RuntimeError(f"Web search failed: {str(e)}")
 
+    async def _post_with_retry(self, payload: dict, stream: bool = False) -> httpx.Response:
+        """
+        POST a search to Tavily, retrying transient failures.
+
+        429s, 5xx responses and connection errors are retried up to
+        _MAX_ATTEMPTS times with exponential backoff and jitter (or the server's
+        Retry-After delay). Every attempt first waits for the rate limiter.
+
+        With stream=True the body is left unread and the caller must close the
+        returned response.
+
+        Raises:
+            httpx.HTTPError: If the last attempt still fails, or on a non-retryable error
+        """
+        for attempt in range(_MAX_ATTEMPTS):
+            await self._rate_limiter.acquire()
+            try:
+                # Make the API call to Tavily
+                # search_depth="advanced" means Tavily will:
+                #   - Visit more pages
+                #   - Extract more detailed content
+                #   - Provide better relevance scoring
+                # This is slower but gives higher quality results for research
+                client = get_http_client()
+                request = client.build_request(
+                    "POST",
+                    TAVILY_SEARCH_URL,
+                    json=payload,
+                    headers={"Authorization": f"Bearer {self.api_key}"},
+                )
+                http_response = await client.send(request, stream=stream)
+            except httpx.TransportError:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt, None))
+                continue
+
+            if (
+                http_response.status_code in _RETRY_STATUS_CODES
+                and attempt < _MAX_ATTEMPTS - 1
+            ):
+                await http_response.aclose()
+                await asyncio.sleep(_retry_delay(attempt, http_response))
+                continue
+
+            if http_response.is_error:
+                await http_response.aclose()
+            http_response.raise_for_status()
+            return http_response
+
+    async def batch_search(
+        self,
+        queries: List[str],
+        max_results: int = 10,
+        concurrency: int = 16,
+    ) -> List[Union[List[SourceRaw], Exception]]:
+        """
+        Run several searches concurrently.
+
+        All queries are launched at once over the shared keep-alive pool, with a
+        semaphore capping how many requests are in flight, so N independent
+        queries take roughly as long as the slowest one instead of N times as long.
+
+        Args:
+            queries: The search queries to run
+            max_results: Maximum number of results per query (default: 10)
+            concurrency: Maximum number of requests in flight at once (default: 16)
+
+        Returns:
+            One entry per query, in the same order as `queries`. Each entry is
+            either that query's results (same format as search()) or the
+            exception it raised, so one failed query doesn't lose the others.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def search_one(query: str) -> List[SourceRaw]:
+            async with semaphore:
+                return await self.search(query, max_results=max_results)
+
+        return await asyncio.gather(
+            *(search_one(query) for query in queries),
+            return_exceptions=True,
+        )
+
+
+# Shared tool behind web_search(), created on first use
+_default_tool: Optional[WebSearchTool] = None
+_default_tool_lock = threading.Lock()
+
+
+def _get_default_tool() -> WebSearchTool:
+    """Return the process-wide WebSearchTool, creating it on the first call."""
+    global _default_tool
+    with _default_tool_lock:
+        if _default_tool is None:
+            _default_tool = WebSearchTool()
+        return _default_tool
+
 
 def web_search(query: str, k: int = 10) -> List[Dict[str, str]]:
     """
     Convenience function for web search.
 
-    This is a simpler interface that creates a WebSearchTool instance and
-    performs a search in one call. Useful when you just need to do a quick search
-    without maintaining a WebSearchTool instance.
+    This is a simpler interface that performs a search in one call, using a
+    WebSearchTool shared by every call. Useful when you just need to do a quick
+    search without maintaining a WebSearchTool instance.
 
     Args:
         query: The search query
@@ -123,7 +605,12 @@ def web_search(query: str, k: int = 10) -> List[Dict[str, str]]:
         for result in results:
             print(f"{result['title']}: {result['score']}")
     """
-    # Create a new WebSearchTool instance (will load API key from environment)
-    tool = WebSearchTool()
-    # Perform the search and return results
-    return tool.search(query, max_results=k)
+    # Reuse the shared WebSearchTool (loads the API key from environment the first time)
+    tool = _get_default_tool()
+    # Perform the search on the shared background loop and wait for the results
+    sources = run_sync(tool.search(query, max_results=k))
+    # Plain dicts keep this helper JSON-friendly for the agent's tool messages
+    return [
+        {"title": source.title, "url": source.url, "snippet": source.snippet, "score": source.score}
+        for source in sources
+    ]